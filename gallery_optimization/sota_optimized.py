@@ -1,10 +1,33 @@
-from datetime import datetime
-from typing import List, Optional, Dict, Any
-from bisect import insort
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict, defaultdict
+from datetime import datetime, timedelta
+from itertools import chain
+from typing import List, Optional, Dict, Any, Tuple
+
+# Buffered single-image inserts are merged into the sorted indices in batches
+# of this size (or on the next read, whichever comes first)
+_PENDING_FLUSH_THRESHOLD = 256
+
+# Most-recently-used pagination results kept per gallery; real traffic
+# re-requests the same few pages, so a small cache captures most hits
+_PAGE_CACHE_MAXSIZE = 128
+
+# Reference point for integer timestamps. Timestamps are stored as exact
+# microseconds since this epoch so sort keys compare int-first: a C long
+# comparison instead of datetime's rich-comparison protocol, and no local-
+# timezone interpretation or float rounding from datetime.timestamp().
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
 
 
 class Image:
-    def __init__(self, id: str, filename: str, album_id: Optional[str], 
+    # Fixed slot layout instead of a per-instance __dict__: attribute reads
+    # in the hot paths skip a dict lookup, and at gallery scale (thousands of
+    # instances) the per-image memory drop is substantial
+    __slots__ = ('id', 'filename', 'album_id', 'uploaded_at', 'size_bytes',
+                 'width', 'height', '_ts_us', '_sort_key', '_dict_cache')
+
+    def __init__(self, id: str, filename: str, album_id: Optional[str],
                  uploaded_at: datetime, size_bytes: int, width: int, height: int):
         self.id = id
         self.filename = filename
@@ -13,17 +36,79 @@ class Image:
         self.size_bytes = size_bytes
         self.width = width
         self.height = height
-    
+        # Precomputed sort key: index maintenance reads a stored tuple
+        # instead of re-deriving attributes and allocating a fresh tuple on
+        # every key evaluation. The timestamp component is an exact integer
+        # (microseconds since _EPOCH), so every key comparison starts with a
+        # plain int compare and orders identically to the datetime itself.
+        self._ts_us = (uploaded_at - _EPOCH) // _MICROSECOND
+        self._sort_key = (self._ts_us, id)
+        # Lazily built to_dict result: images are immutable after creation,
+        # so the serialized form (including the isoformat string) is computed
+        # once and shared across every page that includes this image
+        self._dict_cache: Optional[Dict[str, Any]] = None
+
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            'id': self.id,
-            'filename': self.filename,
-            'album_id': self.album_id,
-            'uploaded_at': self.uploaded_at.isoformat(),
-            'size_bytes': self.size_bytes,
-            'width': self.width,
-            'height': self.height
-        }
+        cached = self._dict_cache
+        if cached is None:
+            cached = self._dict_cache = {
+                'id': self.id,
+                'filename': self.filename,
+                'album_id': self.album_id,
+                'uploaded_at': self.uploaded_at.isoformat(),
+                'size_bytes': self.size_bytes,
+                'width': self.width,
+                'height': self.height
+            }
+        return cached
+
+
+class _SortedIndex:
+    """
+    Sorted index over image positions, kept as two parallel flat lists:
+    ``keys`` holds the precomputed (uploaded_at, id) sort keys in ascending
+    order and ``indices`` holds the matching positions in the image list.
+
+    Every operation runs without a Python-level key callback: single inserts
+    are a C-level bisect_left on the key list plus two list.insert memmoves,
+    and bulk merges lean on timsort's natural-run detection (two sorted runs
+    merge in O(N + M) comparisons). Keeping the keys in their own flat list
+    also lets cursor-style lookups bisect the key column directly.
+
+    NOTE: compiling these paths with numba/Cython was considered and
+    rejected. The per-element work here is already interpreter-free -
+    bisect_left, list.insert, sorted and slicing all execute in CPython's C
+    internals - and the data is heterogeneous tuples of str/int, which a JIT
+    would have to box anyway. This sample also deliberately ships without
+    compiled-extension dependencies or a build step.
+    """
+
+    __slots__ = ('keys', 'indices')
+
+    def __init__(self, pairs: Optional[List[tuple]] = None):
+        if pairs:
+            pairs = sorted(pairs)
+            self.keys = [pair[0] for pair in pairs]
+            self.indices = [pair[1] for pair in pairs]
+        else:
+            self.keys = []
+            self.indices = []
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def add(self, key: tuple, img_index: int) -> None:
+        pos = bisect_left(self.keys, key)
+        self.keys.insert(pos, key)
+        self.indices.insert(pos, img_index)
+
+    def update(self, pairs: List[tuple]) -> None:
+        # Sorting the concatenation of two sorted runs is a linear merge in
+        # disguise: timsort detects both runs and gallops through them, so
+        # this stays O(N + M) comparisons with no Python-level merge loop
+        merged = sorted(chain(zip(self.keys, self.indices), sorted(pairs)))
+        self.keys = [pair[0] for pair in merged]
+        self.indices = [pair[1] for pair in merged]
 
 
 class ImageGallery:
@@ -36,6 +121,9 @@ class ImageGallery:
         #
         # Solution: Maintain sorted indices that are incrementally updated on insertion (O(log n) per insert)
         # so pagination can directly slice the pre-sorted structure in O(k) time where k = page_size.
+        # The indices are _SortedIndex instances: parallel flat key/index
+        # lists maintained by C-level bisect, so index upkeep never pays
+        # Python-level key-callback dispatch per comparison.
         #
         # We store indices into self.images rather than Image objects to:
         # 1. Support multiple sort orders without duplicating Image objects
@@ -45,50 +133,68 @@ class ImageGallery:
         # Key for sorting: (uploaded_at, id) - using id as tiebreaker ensures deterministic ordering
         # even when timestamps are identical (critical for pagination consistency).
         
-        self._sorted_indices_asc: List[int] = []   # Indices sorted by (uploaded_at, id) ascending
-        self._sorted_indices_desc: List[int] = []  # Indices sorted by (uploaded_at, id) descending
-        
-        # Album-specific indices: album_id -> {'asc': [...], 'desc': [...]}
-        # Only created on-demand when album filtering is first requested
-        self._album_indices: Dict[str, Dict[str, List[int]]] = {}
+        # A single ascending index serves both directions: descending pages
+        # are reverse-sliced from it, which halves insertion work and index
+        # memory, and avoids the lossy -timestamp() trick a separate
+        # descending structure needed (float precision loss, and an id
+        # tiebreaker that ran the wrong way relative to a true reverse sort).
+        self._sorted_indices_asc = _SortedIndex()  # (uploaded_at, id) ascending
+
+        # Album-specific ascending indices: album_id -> _SortedIndex
+        # Maintained incrementally on every insert, so each album's index is
+        # always complete (no lazy back-fill on first access)
+        self._album_indices: Dict[str, _SortedIndex] = {}
         
         # Track if indices need rebuilding (e.g., if we detect external modification)
         self._indices_valid = True
+
+        # Insertion buffer (BI-Sort pattern): add_image appends here and the
+        # sorted structures absorb the whole buffer at once, either when it
+        # fills or on the next read. Bulk .update() amortizes far better than
+        # one .add() per streamed image.
+        self._pending: List[int] = []
+
+        # LRU cache of recent pagination results. Keys include _version, which
+        # bumps on every mutation, so stale entries can never be served - they
+        # just age out of the LRU.
+        self._version: int = 0
+        self._page_cache: "OrderedDict[tuple, Tuple[tuple, int, int]]" = OrderedDict()
+
+        # Materialized per-album counts, maintained on every insert so count
+        # and album-listing queries never scan the image list
+        self._album_counts: Dict[str, int] = defaultdict(int)
+
+        # Memoized get_all_album_ids result, valid while _version is unchanged
+        self._all_albums_version: int = -1
+        self._all_albums_cached: List[str] = []
     
-    def _get_sort_key(self, img_index: int) -> tuple:
-        """
-        Generate sort key for an image index.
-        Returns (uploaded_at, id) to ensure deterministic ordering.
-        Using id as secondary key prevents non-deterministic results when timestamps match.
-        """
-        img = self.images[img_index]
-        return (img.uploaded_at, img.id)
-    
-    def _insert_sorted_index(self, img_index: int) -> None:
+    def _flush_pending(self) -> None:
         """
-        Insert a new image index into sorted index structures.
-        Uses binary insertion (O(log n) search + O(n) insertion in worst case).
-        This is amortized better than sorting the entire list on every query.
+        Drain the insertion buffer into the sorted index structures.
+        The global index takes the whole batch via .update() (sort the batch,
+        then one timsort merge), which beats per-image .add() dispatch for
+        streamed ingestion; already-materialized album indices absorb the
+        stragglers individually since buffers are small and cache-resident.
         """
-        img = self.images[img_index]
-        sort_key = self._get_sort_key(img_index)
-        
-        # Insert into ascending index
-        insort(self._sorted_indices_asc, img_index, 
-               key=lambda idx: self._get_sort_key(idx))
-        
-        # Insert into descending index (use negated timestamp for reverse sort)
-        # We negate the timestamp to maintain descending order with insort
-        insort(self._sorted_indices_desc, img_index,
-               key=lambda idx: (-self._get_sort_key(idx)[0].timestamp(), self._get_sort_key(idx)[1]))
-        
-        # If image belongs to an album and we're tracking that album, update album indices
-        if img.album_id is not None and img.album_id in self._album_indices:
-            album_data = self._album_indices[img.album_id]
-            insort(album_data['asc'], img_index,
-                   key=lambda idx: self._get_sort_key(idx))
-            insort(album_data['desc'], img_index,
-                   key=lambda idx: (-self._get_sort_key(idx)[0].timestamp(), self._get_sort_key(idx)[1]))
+        pending = self._pending
+        if not pending:
+            return
+        self._pending = []
+
+        images = self.images
+        self._sorted_indices_asc.update([(images[i]._sort_key, i) for i in pending])
+
+        # Album indices are maintained incrementally and are therefore always
+        # complete: a new album starts from an empty index the moment its
+        # first image arrives, so no O(N) back-fill scan is ever needed
+        album_indices = self._album_indices
+        for img_index in pending:
+            img = images[img_index]
+            if img.album_id is not None:
+                album_index = album_indices.get(img.album_id)
+                if album_index is None:
+                    album_index = album_indices[img.album_id] = _SortedIndex()
+                album_index.add(img._sort_key, img_index)
     
     def _rebuild_indices(self) -> None:
         """
@@ -96,66 +202,86 @@ class ImageGallery:
         Called during initialization or if indices become invalid.
         Cost: O(n log n) but only performed once, not on every pagination request.
         """
-        # Sort indices (not images) by their corresponding sort keys
-        self._sorted_indices_asc = sorted(
-            range(len(self.images)),
-            key=lambda idx: self._get_sort_key(idx)
-        )
-        
-        # For descending, we need reverse sort
-        self._sorted_indices_desc = sorted(
-            range(len(self.images)),
-            key=lambda idx: self._get_sort_key(idx),
-            reverse=True
+        # Sort indices (not images) by their corresponding sort keys.
+        #
+        # NOTE: np.argsort(kind='stable') over an int64 timestamp column was
+        # considered for this bulk path; this sample deliberately avoids a
+        # NumPy dependency, and decorate-sort-undecorate over the precomputed
+        # key tuples is the closest stdlib analogue: each key is evaluated
+        # once and the pairs sort in a single C-level timsort.
+        self._sorted_indices_asc = _SortedIndex(
+            [(img._sort_key, idx) for idx, img in enumerate(self.images)]
         )
-        
-        # Clear and rebuild album indices
-        self._album_indices.clear()
+
+        # Rebuild every album index so the always-complete invariant holds.
+        # Walking the freshly sorted global order and appending into per-album
+        # buckets leaves every bucket already sorted - one pass over N images
+        # replaces a separate O(n_a log n_a) sort per album.
+        album_indices: Dict[str, _SortedIndex] = {}
+        images = self.images
+        global_index = self._sorted_indices_asc
+        for key, idx in zip(global_index.keys, global_index.indices):
+            album_id = images[idx].album_id
+            if album_id is not None:
+                bucket = album_indices.get(album_id)
+                if bucket is None:
+                    bucket = album_indices[album_id] = _SortedIndex()
+                bucket.keys.append(key)
+                bucket.indices.append(idx)
+        self._album_indices = album_indices
+
+        # Everything in self.images is now indexed, including any buffered inserts
+        self._pending.clear()
         self._indices_valid = True
-    
+
     def _ensure_album_indices(self, album_id: str) -> None:
         """
-        Lazily build indices for a specific album on first access.
-        This avoids building indices for albums that are never queried.
+        Album indices are maintained incrementally on every insert, so this is
+        only a guard that hands queries for unseen albums an empty index (no
+        O(N) back-fill scan on first access anymore).
         """
         if album_id not in self._album_indices:
-            # Build sorted indices containing only images from this album
-            album_img_indices = [
-                idx for idx in range(len(self.images))
-                if self.images[idx].album_id == album_id
-            ]
-            
-            # Sort ascending
-            asc_indices = sorted(album_img_indices, key=lambda idx: self._get_sort_key(idx))
-            
-            # Sort descending
-            desc_indices = sorted(album_img_indices, key=lambda idx: self._get_sort_key(idx), reverse=True)
-            
-            self._album_indices[album_id] = {
-                'asc': asc_indices,
-                'desc': desc_indices
-            }
+            self._album_indices[album_id] = _SortedIndex()
     
     def add_image(self, image: Image) -> None:
         """
-        Add single image and maintain sorted indices.
-        O(log n) index insertion vs O(1) append, acceptable trade-off for O(k) pagination.
+        Add single image; index maintenance is deferred to the insertion
+        buffer, which is drained in bulk when it fills (or on the next read),
+        so streaming ingestion pays amortized O(N/B + log B) per image instead
+        of a full index insert each call.
         """
         img_index = len(self.images)
         self.images.append(image)
-        self._insert_sorted_index(img_index)
+        self._version += 1
+        if image.album_id is not None:
+            self._album_counts[image.album_id] += 1
+        self._pending.append(img_index)
+        if len(self._pending) >= _PENDING_FLUSH_THRESHOLD:
+            self._flush_pending()
     
     def add_images(self, images: List[Image]) -> None:
         """
-        Bulk add images. For large batches, rebuilding indices is more efficient
-        than inserting one-by-one (O(n log n) vs O(n^2) in worst case).
+        Bulk add images. Small batches (relative to what is already indexed)
+        are merged into the existing sorted indices through the insertion
+        buffer - an O(N + M) run merge - while large batches fall back to a
+        full rebuild, where the O(n log n) sort amortizes better than merging.
         """
         if not images:
             return
-        
-        # For bulk operations, invalidate current indices and rebuild after insertion
+
+        start_index = len(self.images)
         self.images.extend(images)
-        self._rebuild_indices()
+        self._version += 1
+        for img in images:
+            if img.album_id is not None:
+                self._album_counts[img.album_id] += 1
+
+        existing_count = start_index - len(self._pending)
+        if self._indices_valid and len(images) * 4 <= existing_count:
+            self._pending.extend(range(start_index, len(self.images)))
+            self._flush_pending()
+        else:
+            self._rebuild_indices()
     
     def get_paginated_images(
         self,
@@ -176,7 +302,7 @@ class ImageGallery:
         OPTIMIZATION STRATEGY:
         1. Pre-sorted indices maintained incrementally on insertion
         2. Direct index slicing: O(1) to calculate range, O(k) to retrieve k items
-        3. Album-specific indices built lazily and cached
+        3. Album-specific indices maintained incrementally, always complete
         4. Only materialize requested page: O(k) memory for results
         
         PERFORMANCE IMPACT:
@@ -192,36 +318,73 @@ class ImageGallery:
         """
         if page < 1:
             raise ValueError("Page number must be at least 1")
-        
+
+        # OPTIMIZATION: LRU page cache. A hit skips the window walk and the
+        # per-image to_dict materialization entirely; the version component of
+        # the key guarantees entries from before any mutation can't be served.
+        cache_key = (self._version, page, page_size, album_id, sort_ascending)
+        cache_hit = self._page_cache.get(cache_key)
+        if cache_hit is not None:
+            self._page_cache.move_to_end(cache_key)
+            page_dicts, total_count, total_pages = cache_hit
+            return {
+                'images': list(page_dicts),
+                'total_count': total_count,
+                'page': page,
+                'page_size': page_size,
+                'total_pages': total_pages
+            }
+
         # Ensure indices are built (no-op if already valid)
         if not self._indices_valid or not self.images:
             if self.images:
                 self._rebuild_indices()
-        
-        # Select appropriate pre-sorted index based on filters and sort direction
+
+        # Absorb any buffered single-image inserts before reading (must happen
+        # before album indices are materialized, so they see every image once)
+        self._flush_pending()
+
+        # Select appropriate pre-sorted index based on filters
         if album_id is not None:
             # OPTIMIZATION: Use album-specific pre-filtered indices
             # Cost: O(k) vs original O(n) full-dataset scan
             self._ensure_album_indices(album_id)
-            sorted_indices = self._album_indices[album_id]['asc' if sort_ascending else 'desc']
+            sorted_indices = self._album_indices[album_id]
         else:
-            # Use global sorted indices
-            sorted_indices = self._sorted_indices_asc if sort_ascending else self._sorted_indices_desc
-        
+            # Use global sorted index
+            sorted_indices = self._sorted_indices_asc
+
         # Calculate pagination bounds
         total_count = len(sorted_indices)
         total_pages = (total_count + page_size - 1) // page_size if total_count > 0 else 1
-        
+
         start_index = (page - 1) * page_size
         end_index = start_index + page_size
-        
+
         # OPTIMIZATION: Direct slice of pre-sorted indices - O(k) operation
         # Original: sorted entire dataset then sliced - O(n log n + k)
-        page_indices = sorted_indices[start_index:end_index]
-        
-        # Materialize only the requested page - O(k) memory and time
-        result_images = [self.images[idx].to_dict() for idx in page_indices]
+        if sort_ascending:
+            page_indices = sorted_indices.indices[start_index:end_index]
+        else:
+            # Descending pages are the mirrored window of the ascending index,
+            # sliced then reversed; ties on uploaded_at come out in descending
+            # id order, exactly matching sorted(..., reverse=True)
+            start_index_rev = max(0, total_count - end_index)
+            end_index_rev = max(0, total_count - start_index)
+            page_indices = sorted_indices.indices[start_index_rev:end_index_rev][::-1]
         
+        # Materialize only the requested page - O(k) memory and time.
+        # self.images is hoisted to a local so the comprehension does one
+        # fast-path index per element instead of an attribute lookup + index
+        images_list = self.images
+        result_images = [images_list[idx].to_dict() for idx in page_indices]
+
+        # Cache the materialized page (as an immutable tuple) and evict the
+        # least recently used entry once over capacity
+        self._page_cache[cache_key] = (tuple(result_images), total_count, total_pages)
+        if len(self._page_cache) > _PAGE_CACHE_MAXSIZE:
+            self._page_cache.popitem(last=False)
+
         return {
             'images': result_images,
             'total_count': total_count,
@@ -230,19 +393,86 @@ class ImageGallery:
             'total_pages': total_pages
         }
     
+    def get_paginated_images_cursor(
+        self,
+        cursor: Optional[Tuple[datetime, str]] = None,
+        limit: int = 20,
+        album_id: Optional[str] = None,
+        sort_ascending: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Cursor-based pagination: resume from an opaque (uploaded_at, id)
+        position instead of a page number.
+
+        Offset pagination still walks start_index slots into the list, so the
+        cost of deep pages grows with depth, and concurrent inserts shift
+        rows between pages. Here the cursor key is located with one bisect on
+        the flat key column, making every page O(log N + k) regardless of
+        depth, and each page picks up exactly where the previous one ended
+        even if images landed in between.
+
+        Returns the page plus 'next_cursor' (pass it back to continue, None
+        once exhausted) and 'has_more'.
+        """
+        if limit < 1:
+            raise ValueError("Limit must be at least 1")
+
+        if not self._indices_valid and self.images:
+            self._rebuild_indices()
+        self._flush_pending()
+
+        if album_id is not None:
+            self._ensure_album_indices(album_id)
+            index = self._album_indices[album_id]
+        else:
+            index = self._sorted_indices_asc
+
+        keys = index.keys
+        total_count = len(keys)
+        cursor_key = None
+        if cursor is not None:
+            # Cursors carry the public datetime; convert to the integer
+            # microsecond form the key column is stored in
+            cursor_key = ((cursor[0] - _EPOCH) // _MICROSECOND, cursor[1])
+
+        if sort_ascending:
+            start_index = 0 if cursor_key is None else bisect_right(keys, cursor_key)
+            page_indices = index.indices[start_index:start_index + limit]
+            has_more = start_index + limit < total_count
+        else:
+            end_index = total_count if cursor_key is None else bisect_left(keys, cursor_key)
+            start_index = max(0, end_index - limit)
+            page_indices = index.indices[start_index:end_index][::-1]
+            has_more = start_index > 0
+
+        images_list = self.images
+        result_images = [images_list[idx].to_dict() for idx in page_indices]
+
+        next_cursor = None
+        if page_indices and has_more:
+            last = images_list[page_indices[-1]]
+            next_cursor = (last.uploaded_at, last.id)
+
+        return {
+            'images': result_images,
+            'next_cursor': next_cursor,
+            'has_more': has_more,
+            'limit': limit
+        }
+
     def get_album_image_count(self, album_id: str) -> int:
-        count = 0
-        for img in self.images:
-            if img.album_id == album_id:
-                count += 1
-        return count
-    
+        # O(1) read of the maintained counter instead of an O(N) scan
+        return self._album_counts.get(album_id, 0)
+
     def get_all_album_ids(self) -> List[str]:
-        album_ids = set()
-        for img in self.images:
-            if img.album_id is not None:
-                album_ids.add(img.album_id)
-        return list(album_ids)
+        # O(#albums) instead of O(N): the counter dict doubles as the
+        # registry. The listing is memoized against the mutation counter so
+        # repeated calls between inserts return a copy of the cached list
+        # rather than re-walking the dict keys.
+        if self._all_albums_version != self._version:
+            self._all_albums_cached = list(self._album_counts.keys())
+            self._all_albums_version = self._version
+        return list(self._all_albums_cached)
 
 
 def generate_test_images(count: int, num_albums: int = 10) -> List[Image]:
@@ -1,4 +1,5 @@
 import sys
+from collections import Counter
 
 GLOBAL_RECORDS = []
 GLOBAL_NORMALIZED = []
@@ -12,48 +13,23 @@ def load_records():
         })
 
 def normalize_names():
-    for record in GLOBAL_RECORDS:
-        name = record["name"]
-        new_name = ""
-        for ch in name:
-            new_name = new_name + ch.lower()
-        GLOBAL_NORMALIZED.append(new_name)
-
-        for existing in GLOBAL_NORMALIZED:
-            if existing == new_name:
-                pass
+    GLOBAL_NORMALIZED.extend(record["name"].lower() for record in GLOBAL_RECORDS)
 
 def compute_statistics():
-    total = 0
-    count = 0
-
-    for record in GLOBAL_RECORDS:
-        for record2 in GLOBAL_RECORDS:
-            if record["id"] == record2["id"]:
-                total = total + record["value"]
-                count = count + 1
+    total = sum(record["value"] for record in GLOBAL_RECORDS)
+    count = len(GLOBAL_RECORDS)
 
     return total, count
 
 def generate_report(total, count):
-    report = ""
-
-    for name in GLOBAL_NORMALIZED:
-        for ch in name:
-            report = report + ch
-
-    report = report + "\nTOTAL=" + str(total)
-    report = report + "\nCOUNT=" + str(count)
+    report = "".join(GLOBAL_NORMALIZED)
+    report += "\nTOTAL=" + str(total)
+    report += "\nCOUNT=" + str(count)
 
     return report
 
 def analyze_report(report):
-    occurrences = 0
-
-    for i in range(len(report)):
-        for j in range(len(report)):
-            if report[i] == report[j]:
-                occurrences = occurrences + 1
+    occurrences = sum(c * c for c in Counter(report).values())
 
     if occurrences > 0:
         print("Analysis count:", occurrences)